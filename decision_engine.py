@@ -3,40 +3,285 @@ Database Decision Engine
 Core logic for comparing MySQL, PostgreSQL, and MongoDB
 """
 
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+import itertools
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, replace
 
+import numpy as np
 
-@dataclass
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+# Criteria in scoring order; index into the packed rules array
+_CRITERIA = ('app_type', 'data_structure', 'scalability', 'transactions',
+             'schema_flexibility')
+
+# One bit per (criterion, value): input checks become single AND tests
+_APP_WEB = 1 << 0
+_APP_ANALYTICS = 1 << 1
+_APP_REALTIME = 1 << 2
+_DATA_STRUCTURED = 1 << 3
+_DATA_SEMI = 1 << 4
+_DATA_UNSTRUCTURED = 1 << 5
+_SCALE_LOW = 1 << 6
+_SCALE_MEDIUM = 1 << 7
+_SCALE_HIGH = 1 << 8
+_TRANS_LOW = 1 << 9
+_TRANS_HIGH = 1 << 10
+_SCHEMA_YES = 1 << 11
+_SCHEMA_NO = 1 << 12
+
+_VALUE_BITS = {
+    ('app_type', 'Web'): _APP_WEB,
+    ('app_type', 'Analytics'): _APP_ANALYTICS,
+    ('app_type', 'Real-time'): _APP_REALTIME,
+    ('data_structure', 'Structured'): _DATA_STRUCTURED,
+    ('data_structure', 'Semi-structured'): _DATA_SEMI,
+    ('data_structure', 'Unstructured'): _DATA_UNSTRUCTURED,
+    ('scalability', 'Low'): _SCALE_LOW,
+    ('scalability', 'Medium'): _SCALE_MEDIUM,
+    ('scalability', 'High'): _SCALE_HIGH,
+    ('transactions', 'Low'): _TRANS_LOW,
+    ('transactions', 'High'): _TRANS_HIGH,
+    ('schema_flexibility', 'Yes'): _SCHEMA_YES,
+    ('schema_flexibility', 'No'): _SCHEMA_NO
+}
+
+
+# Matches any input (empty condition)
+_ALWAYS = 0
+
+# Confidence enum used by the compiled decision kernel
+_CONFIDENCE_LEVELS = ('High', 'Medium', 'Low')
+
+# Zero-score template; dict.copy is a C-level copy, cheaper than
+# rebuilding the literal per call
+_ZERO_SCORES = {'mysql': 0, 'postgresql': 0, 'mongodb': 0}
+
+# Static database pros/cons, frozen once at import and shared by every
+# profile instance
+_MYSQL_PROS = (
+    'Mature and widely adopted with extensive community support',
+    'Excellent for structured data with ACID compliance',
+    'Strong performance for read-heavy workloads',
+    'Easy to learn and widely supported by hosting providers',
+    'Great for traditional web applications'
+)
+_MYSQL_CONS = (
+    'Limited support for complex analytics queries',
+    'Horizontal scaling requires additional complexity (sharding)',
+    'Less flexible with schema changes',
+    'JSON support is basic compared to PostgreSQL',
+    'Advanced features lag behind PostgreSQL'
+)
+_POSTGRESQL_PROS = (
+    'Most advanced open-source relational database',
+    'Excellent for complex queries and analytics',
+    'Superior JSON/JSONB support for semi-structured data',
+    'Strong extensibility with custom functions and data types',
+    'Best-in-class data integrity and ACID compliance'
+)
+_POSTGRESQL_CONS = (
+    'Slightly steeper learning curve than MySQL',
+    'Higher memory consumption',
+    'Horizontal scaling still requires effort',
+    'Can be overkill for simple applications',
+    'Configuration complexity for optimization'
+)
+_MONGODB_PROS = (
+    'Excellent horizontal scalability (built-in sharding)',
+    'Schema flexibility for evolving data models',
+    'High performance for real-time applications',
+    'Natural fit for JSON/document-based data',
+    'Easy to get started with minimal setup'
+)
+_MONGODB_CONS = (
+    'Eventual consistency can complicate transactions',
+    'No built-in joins (requires application-level logic)',
+    'Higher storage overhead',
+    'Not ideal for complex relational data',
+    'ACID transactions only within single documents by default'
+)
+
+# Static reasoning text, allocated once at import
+_REASONS = {
+    'mysql_base': 'MySQL is recommended for your traditional web application needs '
+                  'with structured data.',
+    'mysql_txn': 'Strong ACID compliance meets your transaction requirements.',
+    'mysql_vertical': 'Vertical scaling is sufficient for your scalability needs.',
+    'mysql_web': 'Proven track record for web applications with excellent '
+                 'community support.',
+    'postgresql_base': 'PostgreSQL offers the best balance of advanced features for '
+                       'your requirements.',
+    'postgresql_analytics': 'Superior query optimization and window functions support '
+                            'complex analytics workloads.',
+    'postgresql_semi': 'Excellent JSONB support handles semi-structured data efficiently '
+                       'while maintaining relational integrity.',
+    'postgresql_txn': 'Industry-leading ACID compliance and advanced transaction '
+                      'isolation ensures data integrity.',
+    'postgresql_schema': 'JSONB and extension support provide flexibility while maintaining '
+                         'SQL capabilities.',
+    'mongodb_base': 'MongoDB is the best choice for your scalability and flexibility needs.',
+    'mongodb_scale': 'Built-in sharding provides excellent horizontal scalability '
+                     'without complex configuration.',
+    'mongodb_schema': 'Schema-less design allows rapid iteration and accommodates '
+                      'evolving data models.',
+    'mongodb_realtime': 'Optimized for high-throughput real-time applications with '
+                        'low-latency operations.',
+    'mongodb_unstructured': 'Document model naturally fits unstructured and hierarchical data.'
+}
+
+# Per-database reasoning rules as (condition bits, reason key). A rule
+# fires when any of its condition bits is set (or unconditionally for
+# _ALWAYS); multi-bit conditions express "one of these values".
+_REASON_RULES = {
+    'MySQL': (
+        (_ALWAYS, 'mysql_base'),
+        (_TRANS_HIGH, 'mysql_txn'),
+        (_SCALE_LOW | _SCALE_MEDIUM, 'mysql_vertical'),
+        (_APP_WEB, 'mysql_web')
+    ),
+    'PostgreSQL': (
+        (_ALWAYS, 'postgresql_base'),
+        (_APP_ANALYTICS, 'postgresql_analytics'),
+        (_DATA_SEMI, 'postgresql_semi'),
+        (_TRANS_HIGH, 'postgresql_txn'),
+        (_SCHEMA_YES, 'postgresql_schema')
+    ),
+    'MongoDB': (
+        (_ALWAYS, 'mongodb_base'),
+        (_SCALE_HIGH, 'mongodb_scale'),
+        (_SCHEMA_YES, 'mongodb_schema'),
+        (_APP_REALTIME, 'mongodb_realtime'),
+        (_DATA_UNSTRUCTURED, 'mongodb_unstructured')
+    )
+}
+
+
+def _inputs_to_mask(user_inputs: 'UserInputs') -> int:
+    """Fold the user selections into a single criterion-value bitmask"""
+    mask = 0
+    for pair in zip(_CRITERIA, user_inputs):
+        mask |= _VALUE_BITS.get(pair, 0)
+    return mask
+
+
+if _NUMBA_AVAILABLE:
+    # Explicit signature so compilation happens at import time (and is
+    # cached on disk), not on the first analyze call
+    @njit('i1[:](i1[:,:,:], i1[:])', cache=True)
+    def _score_kernel(rules, idx):
+        out = np.zeros(3, dtype=np.int8)
+        for c in range(5):
+            v = idx[c]
+            if v >= 0:  # -1 marks an unrecognized criterion value
+                for d in range(3):
+                    out[d] += rules[c, v, d]
+        return out
+
+    # Full decision pipeline in one compiled pass: scores, winner,
+    # confidence enum, and one bit per firing tradeoff/alternative rule.
+    # Trigger rows hold the required value index per criterion (-1 means
+    # "don't care"); string assembly stays in Python.
+    @njit('i4[:](i1[:,:,:], i1[:], i1[:,:], i1[:,:])', cache=True)
+    def _decide(rules, idx, tradeoff_triggers, alternative_triggers):
+        out = np.zeros(7, dtype=np.int32)
+        for c in range(5):
+            v = idx[c]
+            for d in range(3):
+                out[d] += rules[c, v, d]
+        # First index holding the maximum score, matching the stable
+        # descending sort in generate_database_profiles
+        top = 0
+        if out[1] > out[top]:
+            top = 1
+        if out[2] > out[top]:
+            top = 2
+        second = -1
+        for d in range(3):
+            if d != top and out[d] > second:
+                second = out[d]
+        diff = out[top] - second
+        if diff > 3:
+            confidence = 0
+        elif diff > 1:
+            confidence = 1
+        else:
+            confidence = 2
+        out[3] = top
+        out[4] = confidence
+        for r in range(tradeoff_triggers.shape[0]):
+            for c in range(5):
+                want = tradeoff_triggers[r, c]
+                if want >= 0 and want != idx[c]:
+                    break
+            else:
+                out[5] |= 1 << r
+        for r in range(alternative_triggers.shape[0]):
+            for c in range(5):
+                want = alternative_triggers[r, c]
+                if want >= 0 and want != idx[c]:
+                    break
+            else:
+                out[6] |= 1 << r
+        return out
+
+
+class UserInputs(NamedTuple):
+    """User selections for the five decision criteria.
+
+    Field order matches _CRITERIA, so zip(_CRITERIA, inputs) yields the
+    (criterion, value) pairs used by the rule tables.
+    """
+    app_type: str
+    data_structure: str
+    scalability: str
+    transactions: str
+    schema_flexibility: str
+
+    @classmethod
+    def from_dict(cls, user_inputs: Dict[str, str]) -> 'UserInputs':
+        """Build from the dict form accepted by the public analyze API"""
+        return cls(user_inputs['app_type'], user_inputs['data_structure'],
+                   user_inputs['scalability'], user_inputs['transactions'],
+                   user_inputs['schema_flexibility'])
+
+
+@dataclass(slots=True, frozen=True)
 class DatabaseProfile:
     """Data class representing a database profile"""
     name: str
     db_type: str
     score: int
-    pros: List[str]
-    cons: List[str]
+    pros: Tuple[str, ...]
+    cons: Tuple[str, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Tradeoff:
     """Data class representing a trade-off"""
     title: str
     description: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Alternative:
     """Data class representing an alternative database"""
     database: str
     reason: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Recommendation:
     """Data class representing the final recommendation"""
     database: str
     confidence: str
-    reasoning: List[str]
+    reasoning: Tuple[str, ...]
 
 
 class DecisionEngine:
@@ -49,6 +294,17 @@ class DecisionEngine:
         self.databases = ['mysql', 'postgresql', 'mongodb']
         self._initialize_scoring_rules()
         self._initialize_database_profiles()
+        self._initialize_rule_index()
+        # The input space is finite (3*3*3*2*2 = 108 combinations), so
+        # every outcome is computed once here and analyze collapses to a
+        # dict lookup. Unknown values fall back to the computing path.
+        self._precomputed = {
+            inputs: self._compute_analysis(inputs)
+            for inputs in map(UserInputs._make, itertools.product(
+                self.app_type_scores, self.data_structure_scores,
+                self.scalability_scores, self.transaction_scores,
+                self.schema_scores))
+        }
     
     def _initialize_scoring_rules(self):
         """Initialize scoring rules for each criterion"""
@@ -85,6 +341,36 @@ class DecisionEngine:
             'Yes': {'mysql': 1, 'postgresql': 2, 'mongodb': 4},
             'No': {'mysql': 4, 'postgresql': 4, 'mongodb': 2}
         }
+
+        # Flat lookup table: (criterion, value) -> int8 score vector in
+        # self.databases order, so scoring is one vectorized reduction
+        # instead of per-criterion dict walks
+        self._score_table = {
+            (criterion, value): np.array([d['mysql'], d['postgresql'], d['mongodb']],
+                                         dtype=np.int8)
+            for criterion, table in [('app_type', self.app_type_scores),
+                                     ('data_structure', self.data_structure_scores),
+                                     ('scalability', self.scalability_scores),
+                                     ('transactions', self.transaction_scores),
+                                     ('schema_flexibility', self.schema_scores)]
+            for value, d in table.items()
+        }
+
+        # Integer encoding of the same rules for the JIT kernel: value
+        # index per (criterion, value), packed into rules[crit, value, db]
+        self._value_index = {}
+        self._rules = np.zeros((5, 3, 3), dtype=np.int8)
+        tables = (self.app_type_scores, self.data_structure_scores,
+                  self.scalability_scores, self.transaction_scores,
+                  self.schema_scores)
+        for c, (criterion, table) in enumerate(zip(_CRITERIA, tables)):
+            for v, (value, d) in enumerate(table.items()):
+                self._value_index[(criterion, value)] = v
+                self._rules[c, v] = (d['mysql'], d['postgresql'], d['mongodb'])
+
+        if _NUMBA_AVAILABLE:
+            # Warm the kernel so first-call latency isn't paid by a user
+            _score_kernel(self._rules, np.zeros(5, dtype=np.int8))
     
     def _initialize_database_profiles(self):
         """Initialize static database profiles with pros and cons"""
@@ -93,376 +379,403 @@ class DecisionEngine:
             'mysql': {
                 'name': 'MySQL',
                 'type': 'Relational (SQL)',
-                'pros': [
-                    'Mature and widely adopted with extensive community support',
-                    'Excellent for structured data with ACID compliance',
-                    'Strong performance for read-heavy workloads',
-                    'Easy to learn and widely supported by hosting providers',
-                    'Great for traditional web applications'
-                ],
-                'cons': [
-                    'Limited support for complex analytics queries',
-                    'Horizontal scaling requires additional complexity (sharding)',
-                    'Less flexible with schema changes',
-                    'JSON support is basic compared to PostgreSQL',
-                    'Advanced features lag behind PostgreSQL'
-                ]
+                'pros': _MYSQL_PROS,
+                'cons': _MYSQL_CONS
             },
             'postgresql': {
                 'name': 'PostgreSQL',
                 'type': 'Relational (SQL)',
-                'pros': [
-                    'Most advanced open-source relational database',
-                    'Excellent for complex queries and analytics',
-                    'Superior JSON/JSONB support for semi-structured data',
-                    'Strong extensibility with custom functions and data types',
-                    'Best-in-class data integrity and ACID compliance'
-                ],
-                'cons': [
-                    'Slightly steeper learning curve than MySQL',
-                    'Higher memory consumption',
-                    'Horizontal scaling still requires effort',
-                    'Can be overkill for simple applications',
-                    'Configuration complexity for optimization'
-                ]
+                'pros': _POSTGRESQL_PROS,
+                'cons': _POSTGRESQL_CONS
             },
             'mongodb': {
                 'name': 'MongoDB',
                 'type': 'NoSQL (Document)',
-                'pros': [
-                    'Excellent horizontal scalability (built-in sharding)',
-                    'Schema flexibility for evolving data models',
-                    'High performance for real-time applications',
-                    'Natural fit for JSON/document-based data',
-                    'Easy to get started with minimal setup'
-                ],
-                'cons': [
-                    'Eventual consistency can complicate transactions',
-                    'No built-in joins (requires application-level logic)',
-                    'Higher storage overhead',
-                    'Not ideal for complex relational data',
-                    'ACID transactions only within single documents by default'
-                ]
+                'pros': _MONGODB_PROS,
+                'cons': _MONGODB_CONS
             }
         }
-    
-    def calculate_scores(self, user_inputs: Dict[str, str]) -> Dict[str, int]:
+
+        # Immutable per-database templates: generate_database_profiles
+        # only swaps in the score, sharing the pros/cons tuples
+        self._profile_templates = {
+            db: DatabaseProfile(
+                name=info['name'],
+                db_type=info['type'],
+                score=0,
+                pros=info['pros'],
+                cons=info['cons']
+            )
+            for db, info in self.db_profiles.items()
+        }
+
+    def _initialize_rule_index(self):
+        """Index tradeoff and alternative rules by their trigger pairs.
+
+        Each rule is stored once with its definition order, keyed by the
+        (criterion, value) pairs that trigger it, so matching is a set
+        lookup instead of a chain of string comparisons.
+        """
+        tradeoff_rules = [
+            ({('data_structure', 'Structured'), ('schema_flexibility', 'Yes')},
+             Tradeoff(
+                 title='Schema Rigidity vs Flexibility',
+                 description='You want structured data but also schema flexibility. '
+                            'SQL databases enforce schemas strongly, while MongoDB offers '
+                            'flexibility but sacrifices relational integrity.'
+             )),
+            ({('scalability', 'High'), ('transactions', 'High')},
+             Tradeoff(
+                 title='Consistency vs Scalability (CAP Theorem)',
+                 description='High scalability often requires eventual consistency (MongoDB), '
+                            'but high transaction requirements need strong ACID guarantees '
+                            '(PostgreSQL/MySQL). This is a fundamental distributed systems trade-off.'
+             )),
+            ({('app_type', 'Analytics'), ('scalability', 'High')},
+             Tradeoff(
+                 title='SQL vs NoSQL for Analytics',
+                 description='SQL databases excel at complex queries and joins, but NoSQL scales '
+                            'better horizontally. Consider PostgreSQL with read replicas or '
+                            'specialized analytics databases like ClickHouse.'
+             )),
+            ({('data_structure', 'Unstructured'), ('transactions', 'High')},
+             Tradeoff(
+                 title='Document Flexibility vs Transaction Integrity',
+                 description='MongoDB handles unstructured data well but has limited multi-document '
+                            'transaction support. PostgreSQL JSONB offers a middle ground with '
+                            'strong transactions and flexible document storage.'
+             )),
+            ({('app_type', 'Web')},
+             Tradeoff(
+                 title='Read Optimization vs Write Optimization',
+                 description='MySQL excels at read-heavy workloads, MongoDB at write-heavy ones. '
+                            'PostgreSQL balances both. Consider your read/write ratio.'
+             )),
+        ]
+
+        alternative_rules = [
+            ({('app_type', 'Analytics'), ('scalability', 'High')},
+             Alternative(
+                 database='ClickHouse or Apache Druid',
+                 reason='Columnar databases optimized for massive-scale analytics and '
+                        'OLAP queries with superior compression and query performance.'
+             )),
+            ({('app_type', 'Real-time'), ('data_structure', 'Unstructured')},
+             Alternative(
+                 database='Redis or Apache Kafka',
+                 reason='In-memory data stores and streaming platforms optimized for '
+                        'real-time data processing and sub-millisecond latency.'
+             )),
+            ({('scalability', 'High'), ('transactions', 'High')},
+             Alternative(
+                 database='CockroachDB or Google Spanner',
+                 reason='Distributed SQL databases offering both horizontal scalability and '
+                        'strong consistency (bypassing CAP theorem limitations).'
+             )),
+            ({('data_structure', 'Unstructured'), ('app_type', 'Analytics')},
+             Alternative(
+                 database='Elasticsearch',
+                 reason='Excellent for full-text search, log analytics, and unstructured '
+                        'data exploration with powerful aggregation capabilities.'
+             )),
+            ({('app_type', 'Real-time')},
+             Alternative(
+                 database='TimescaleDB or InfluxDB',
+                 reason='Specialized time-series databases for IoT, monitoring, and '
+                        'event-driven applications requiring time-based queries.'
+             )),
+        ]
+
+        # Uniform rule lists in definition order: a rule fires when its
+        # trigger set is a subset of the active (criterion, value) pairs
+        self._tradeoff_rules = [(frozenset(trigger), tradeoff)
+                                for trigger, tradeoff in tradeoff_rules]
+        self._alternative_rules = [(frozenset(trigger), alternative)
+                                   for trigger, alternative in alternative_rules]
+
+        # Integer encoding for the compiled pipeline: rule id = position
+        # in the lists above, bit r of the kernel's masks selects
+        # _tradeoff_objs[r] / _alternative_objs[r]
+        self._tradeoff_objs = tuple(obj for _, obj in self._tradeoff_rules)
+        self._alternative_objs = tuple(obj for _, obj in self._alternative_rules)
+        self._tradeoff_triggers = self._encode_triggers(tradeoff_rules)
+        self._alternative_triggers = self._encode_triggers(alternative_rules)
+
+        if _NUMBA_AVAILABLE:
+            # Warm the fused kernel alongside the scoring one
+            _decide(self._rules, np.zeros(5, dtype=np.int8),
+                    self._tradeoff_triggers, self._alternative_triggers)
+
+    def _encode_triggers(self, rules) -> np.ndarray:
+        """Pack rule triggers into an int8 matrix for the JIT kernel.
+
+        Row r holds the required value index per criterion for rule r,
+        with -1 marking criteria the rule does not constrain.
+        """
+        triggers = np.full((len(rules), len(_CRITERIA)), -1, dtype=np.int8)
+        for r, (trigger, _) in enumerate(rules):
+            for criterion, value in trigger:
+                triggers[r, _CRITERIA.index(criterion)] = \
+                    self._value_index[(criterion, value)]
+        return triggers
+
+    def calculate_scores(self,
+                         user_inputs: Union[Dict[str, str], UserInputs]
+                         ) -> Dict[str, int]:
         """
         Calculate scores for each database based on user inputs.
-        
+
         Args:
-            user_inputs: Dictionary containing user selections
-            
+            user_inputs: UserInputs tuple, or the equivalent dictionary
+
         Returns:
             Dictionary with database scores
         """
-        scores = {db: 0 for db in self.databases}
-        
-        # Application Type
-        if user_inputs['app_type'] in self.app_type_scores:
-            for db in self.databases:
-                scores[db] += self.app_type_scores[user_inputs['app_type']][db]
-        
-        # Data Structure
-        if user_inputs['data_structure'] in self.data_structure_scores:
-            for db in self.databases:
-                scores[db] += self.data_structure_scores[user_inputs['data_structure']][db]
-        
-        # Scalability
-        if user_inputs['scalability'] in self.scalability_scores:
-            for db in self.databases:
-                scores[db] += self.scalability_scores[user_inputs['scalability']][db]
-        
-        # Transactions
-        if user_inputs['transactions'] in self.transaction_scores:
-            for db in self.databases:
-                scores[db] += self.transaction_scores[user_inputs['transactions']][db]
-        
-        # Schema Flexibility
-        if user_inputs['schema_flexibility'] in self.schema_scores:
-            for db in self.databases:
-                scores[db] += self.schema_scores[user_inputs['schema_flexibility']][db]
-        
-        return scores
+        if not isinstance(user_inputs, UserInputs):
+            user_inputs = UserInputs.from_dict(user_inputs)
+        if _NUMBA_AVAILABLE:
+            # Encode the selections as value indices (-1 = unknown) and
+            # let the compiled kernel do the reduction
+            idx = np.array([self._value_index.get(pair, -1)
+                            for pair in zip(_CRITERIA, user_inputs)], dtype=np.int8)
+            total = _score_kernel(self._rules, idx)
+            return {'mysql': int(total[0]), 'postgresql': int(total[1]),
+                    'mongodb': int(total[2])}
+
+        # One int8 vector per criterion; unknown values simply contribute
+        # nothing, matching the old membership guards
+        arrs = [self._score_table.get(pair)
+                for pair in zip(_CRITERIA, user_inputs)]
+        arrs = [a for a in arrs if a is not None]
+        if not arrs:
+            return _ZERO_SCORES.copy()
+
+        total = np.add.reduce(arrs)
+        return {'mysql': int(total[0]), 'postgresql': int(total[1]),
+                'mongodb': int(total[2])}
     
-    def generate_database_profiles(self, scores: Dict[str, int]) -> List[DatabaseProfile]:
+    def generate_database_profiles(self, scores: Dict[str, int]
+                                   ) -> Tuple[DatabaseProfile, ...]:
         """
         Generate database profiles with scores.
-        
+
         Args:
             scores: Dictionary with database scores
-            
+
         Returns:
-            List of DatabaseProfile objects sorted by score
+            Tuple of DatabaseProfile objects sorted by score
         """
-        profiles = []
-        
-        for db_key in self.databases:
-            profile = DatabaseProfile(
-                name=self.db_profiles[db_key]['name'],
-                db_type=self.db_profiles[db_key]['type'],
-                score=scores[db_key],
-                pros=self.db_profiles[db_key]['pros'],
-                cons=self.db_profiles[db_key]['cons']
-            )
-            profiles.append(profile)
-        
-        # Sort by score in descending order
-        profiles.sort(key=lambda x: x.score, reverse=True)
-        
-        return profiles
+        # Exactly three databases in this domain: unrolled construction
+        # and a fixed compare-and-swap network instead of list.sort
+        templates = self._profile_templates
+        a = replace(templates['mysql'], score=scores['mysql'])
+        b = replace(templates['postgresql'], score=scores['postgresql'])
+        c = replace(templates['mongodb'], score=scores['mongodb'])
+
+        # Descending, stable: strict compares never reorder equal scores
+        if a.score < b.score:
+            a, b = b, a
+        if b.score < c.score:
+            b, c = c, b
+        if a.score < b.score:
+            a, b = b, a
+
+        return (a, b, c)
     
-    def identify_tradeoffs(self, user_inputs: Dict[str, str]) -> List[Tradeoff]:
+    def identify_tradeoffs(self,
+                           user_inputs: Union[Dict[str, str], UserInputs]
+                           ) -> Tuple[Tradeoff, ...]:
         """
         Identify relevant trade-offs based on user inputs.
-        
+
         Args:
-            user_inputs: Dictionary containing user selections
-            
+            user_inputs: UserInputs tuple, or the equivalent dictionary
+
         Returns:
-            List of Tradeoff objects
+            Tuple of Tradeoff objects
         """
-        tradeoffs = []
-        
-        # Schema rigidity vs flexibility
-        if (user_inputs['data_structure'] == 'Structured' and 
-            user_inputs['schema_flexibility'] == 'Yes'):
-            tradeoffs.append(Tradeoff(
-                title='Schema Rigidity vs Flexibility',
-                description='You want structured data but also schema flexibility. '
-                           'SQL databases enforce schemas strongly, while MongoDB offers '
-                           'flexibility but sacrifices relational integrity.'
-            ))
-        
-        # Consistency vs scalability
-        if (user_inputs['scalability'] == 'High' and 
-            user_inputs['transactions'] == 'High'):
-            tradeoffs.append(Tradeoff(
-                title='Consistency vs Scalability (CAP Theorem)',
-                description='High scalability often requires eventual consistency (MongoDB), '
-                           'but high transaction requirements need strong ACID guarantees '
-                           '(PostgreSQL/MySQL). This is a fundamental distributed systems trade-off.'
-            ))
-        
-        # SQL vs NoSQL for analytics
-        if (user_inputs['app_type'] == 'Analytics' and 
-            user_inputs['scalability'] == 'High'):
-            tradeoffs.append(Tradeoff(
-                title='SQL vs NoSQL for Analytics',
-                description='SQL databases excel at complex queries and joins, but NoSQL scales '
-                           'better horizontally. Consider PostgreSQL with read replicas or '
-                           'specialized analytics databases like ClickHouse.'
-            ))
-        
-        # Document flexibility vs transaction integrity
-        if (user_inputs['data_structure'] == 'Unstructured' and 
-            user_inputs['transactions'] == 'High'):
-            tradeoffs.append(Tradeoff(
-                title='Document Flexibility vs Transaction Integrity',
-                description='MongoDB handles unstructured data well but has limited multi-document '
-                           'transaction support. PostgreSQL JSONB offers a middle ground with '
-                           'strong transactions and flexible document storage.'
-            ))
-        
-        # Read vs write optimization
-        if user_inputs['app_type'] == 'Web':
-            tradeoffs.append(Tradeoff(
-                title='Read Optimization vs Write Optimization',
-                description='MySQL excels at read-heavy workloads, MongoDB at write-heavy ones. '
-                           'PostgreSQL balances both. Consider your read/write ratio.'
-            ))
-        
-        return tradeoffs
-    
-    def generate_recommendation(self, profiles: List[DatabaseProfile], 
-                               user_inputs: Dict[str, str]) -> Recommendation:
+        if not isinstance(user_inputs, UserInputs):
+            user_inputs = UserInputs.from_dict(user_inputs)
+        active = frozenset(zip(_CRITERIA, user_inputs))
+        return tuple(tradeoff for trigger, tradeoff in self._tradeoff_rules
+                     if trigger <= active)
+
+    def generate_recommendation(self, profiles: Sequence[DatabaseProfile],
+                               user_inputs: Union[Dict[str, str], UserInputs],
+                               score_diff: Optional[int] = None,
+                               confidence: Optional[str] = None) -> Recommendation:
         """
         Generate final recommendation with reasoning.
-        
+
         Args:
-            profiles: List of DatabaseProfile objects (sorted by score)
-            user_inputs: Dictionary containing user selections
-            
+            profiles: DatabaseProfile objects sorted by score
+            user_inputs: UserInputs tuple, or the equivalent dictionary
+            score_diff: Gap between the top two scores, if the caller
+                already computed it
+            confidence: Confidence level, if the caller already derived
+                it (e.g. from the compiled pipeline)
+
         Returns:
             Recommendation object
         """
+        if not isinstance(user_inputs, UserInputs):
+            user_inputs = UserInputs.from_dict(user_inputs)
+
+        if score_diff is None:
+            score_diff = (profiles[0].score - profiles[1].score
+                          if len(profiles) > 1 else 5)
+
         top_db = profiles[0]
-        reasoning = []
-        
-        # MySQL-specific reasoning
-        if top_db.name == 'MySQL':
-            reasoning.append('MySQL is recommended for your traditional web application needs '
-                           'with structured data.')
-            
-            if user_inputs['transactions'] == 'High':
-                reasoning.append('Strong ACID compliance meets your transaction requirements.')
-            
-            if user_inputs['scalability'] != 'High':
-                reasoning.append('Vertical scaling is sufficient for your scalability needs.')
-            
-            if user_inputs['app_type'] == 'Web':
-                reasoning.append('Proven track record for web applications with excellent '
-                               'community support.')
-        
-        # PostgreSQL-specific reasoning
-        elif top_db.name == 'PostgreSQL':
-            reasoning.append('PostgreSQL offers the best balance of advanced features for '
-                           'your requirements.')
-            
-            if user_inputs['app_type'] == 'Analytics':
-                reasoning.append('Superior query optimization and window functions support '
-                               'complex analytics workloads.')
-            
-            if user_inputs['data_structure'] == 'Semi-structured':
-                reasoning.append('Excellent JSONB support handles semi-structured data efficiently '
-                               'while maintaining relational integrity.')
-            
-            if user_inputs['transactions'] == 'High':
-                reasoning.append('Industry-leading ACID compliance and advanced transaction '
-                               'isolation ensures data integrity.')
-            
-            if user_inputs['schema_flexibility'] == 'Yes':
-                reasoning.append('JSONB and extension support provide flexibility while maintaining '
-                               'SQL capabilities.')
-        
-        # MongoDB-specific reasoning
-        else:  # MongoDB
-            reasoning.append('MongoDB is the best choice for your scalability and flexibility needs.')
-            
-            if user_inputs['scalability'] == 'High':
-                reasoning.append('Built-in sharding provides excellent horizontal scalability '
-                               'without complex configuration.')
-            
-            if user_inputs['schema_flexibility'] == 'Yes':
-                reasoning.append('Schema-less design allows rapid iteration and accommodates '
-                               'evolving data models.')
-            
-            if user_inputs['app_type'] == 'Real-time':
-                reasoning.append('Optimized for high-throughput real-time applications with '
-                               'low-latency operations.')
-            
-            if user_inputs['data_structure'] == 'Unstructured':
-                reasoning.append('Document model naturally fits unstructured and hierarchical data.')
-        
+        mask = _inputs_to_mask(user_inputs)
+
+        # Data-driven reasoning: one comprehension over the winner's rule
+        # tuple, so the list is built at C level without repeated resizes
+        reasoning = [_REASONS[reason_key]
+                     for condition, reason_key in _REASON_RULES[top_db.name]
+                     if condition == _ALWAYS or mask & condition]
+
         # Add close competition note
-        if len(profiles) > 1:
-            score_diff = profiles[0].score - profiles[1].score
-            if score_diff <= 2:
-                reasoning.append(f'Note: {profiles[1].name} scored closely '
-                               f'({profiles[1].score} vs {profiles[0].score}). '
-                               f'Consider evaluating both options based on team expertise.')
-        
+        if len(profiles) > 1 and score_diff <= 2:
+            reasoning.append(f'Note: {profiles[1].name} scored closely '
+                           f'({profiles[1].score} vs {profiles[0].score}). '
+                           f'Consider evaluating both options based on team expertise.')
+
         # Determine confidence level
-        score_diff = profiles[0].score - profiles[1].score if len(profiles) > 1 else 5
-        if score_diff > 3:
-            confidence = 'High'
-        elif score_diff > 1:
-            confidence = 'Medium'
-        else:
-            confidence = 'Low'
+        if confidence is None:
+            if score_diff > 3:
+                confidence = 'High'
+            elif score_diff > 1:
+                confidence = 'Medium'
+            else:
+                confidence = 'Low'
         
         return Recommendation(
             database=top_db.name,
             confidence=confidence,
-            reasoning=reasoning
+            reasoning=tuple(reasoning)
         )
     
-    def suggest_alternatives(self, user_inputs: Dict[str, str]) -> List[Alternative]:
+    def suggest_alternatives(self,
+                             user_inputs: Union[Dict[str, str], UserInputs]
+                             ) -> Tuple[Alternative, ...]:
         """
         Suggest alternative databases for specific use cases.
-        
+
         Args:
-            user_inputs: Dictionary containing user selections
-            
+            user_inputs: UserInputs tuple, or the equivalent dictionary
+
         Returns:
-            List of Alternative objects
+            Tuple of Alternative objects
         """
-        alternatives = []
-        
-        # Analytics + High Scalability
-        if (user_inputs['app_type'] == 'Analytics' and 
-            user_inputs['scalability'] == 'High'):
-            alternatives.append(Alternative(
-                database='ClickHouse or Apache Druid',
-                reason='Columnar databases optimized for massive-scale analytics and '
-                       'OLAP queries with superior compression and query performance.'
-            ))
-        
-        # Real-time + Unstructured
-        if (user_inputs['app_type'] == 'Real-time' and 
-            user_inputs['data_structure'] == 'Unstructured'):
-            alternatives.append(Alternative(
-                database='Redis or Apache Kafka',
-                reason='In-memory data stores and streaming platforms optimized for '
-                       'real-time data processing and sub-millisecond latency.'
-            ))
-        
-        # High scalability + High transactions
-        if (user_inputs['scalability'] == 'High' and 
-            user_inputs['transactions'] == 'High'):
-            alternatives.append(Alternative(
-                database='CockroachDB or Google Spanner',
-                reason='Distributed SQL databases offering both horizontal scalability and '
-                       'strong consistency (bypassing CAP theorem limitations).'
-            ))
-        
-        # Unstructured + Analytics
-        if (user_inputs['data_structure'] == 'Unstructured' and 
-            user_inputs['app_type'] == 'Analytics'):
-            alternatives.append(Alternative(
-                database='Elasticsearch',
-                reason='Excellent for full-text search, log analytics, and unstructured '
-                       'data exploration with powerful aggregation capabilities.'
-            ))
-        
-        # Time-series workloads
-        if user_inputs['app_type'] == 'Real-time':
-            alternatives.append(Alternative(
-                database='TimescaleDB or InfluxDB',
-                reason='Specialized time-series databases for IoT, monitoring, and '
-                       'event-driven applications requiring time-based queries.'
-            ))
-        
-        return alternatives
-    
-    def analyze(self, user_inputs: Dict[str, str]) -> Dict:
+        if not isinstance(user_inputs, UserInputs):
+            user_inputs = UserInputs.from_dict(user_inputs)
+        active = frozenset(zip(_CRITERIA, user_inputs))
+        return tuple(alternative
+                     for trigger, alternative in self._alternative_rules
+                     if trigger <= active)
+
+    def analyze(self, user_inputs: Union[Dict[str, str], UserInputs]) -> Mapping:
         """
-        Main analysis method - orchestrates the entire decision process.
-        
+        Main analysis method - looks up the precomputed result.
+
         Args:
-            user_inputs: Dictionary containing user selections
-            
+            user_inputs: UserInputs tuple, or the equivalent dictionary
+                (kept for backward compatibility)
+
         Returns:
-            Dictionary containing complete analysis results
+            Read-only mapping containing complete analysis results
         """
+        if not isinstance(user_inputs, UserInputs):
+            user_inputs = UserInputs.from_dict(user_inputs)
+
+        # Every value is frozen and the mapping itself is a read-only
+        # proxy, so the shared result is returned by reference
+        cached = self._precomputed.get(user_inputs)
+        if cached is not None:
+            return cached
+
+        # Inputs outside the known value space: compute without
+        # memoizing, so arbitrary inputs cannot grow the cache
+        return self._compute_analysis(user_inputs)
+
+    def _compute_analysis(self, user_inputs: UserInputs) -> Mapping:
+        """Run the full decision pipeline for one input combination"""
+        if _NUMBA_AVAILABLE:
+            idx = np.array([self._value_index.get(pair, -1)
+                            for pair in zip(_CRITERIA, user_inputs)], dtype=np.int8)
+            if int(idx.min()) >= 0:  # all values known to the rule tables
+                return self._assemble_decision(user_inputs, _decide(
+                    self._rules, idx,
+                    self._tradeoff_triggers, self._alternative_triggers))
+
+        # Pure-Python pipeline: numba missing, or inputs outside the
+        # known value space
         # Calculate scores
         scores = self.calculate_scores(user_inputs)
-        
+
         # Generate database profiles
         profiles = self.generate_database_profiles(scores)
-        
+
         # Identify trade-offs
         tradeoffs = self.identify_tradeoffs(user_inputs)
-        
+
+        # Top-two gap, computed once and shared by the close-competition
+        # note and the confidence level
+        sorted_scores = np.sort(np.fromiter(scores.values(), dtype=np.int8, count=3))[::-1]
+        score_diff = int(sorted_scores[0] - sorted_scores[1])
+
         # Generate recommendation
-        recommendation = self.generate_recommendation(profiles, user_inputs)
-        
+        recommendation = self.generate_recommendation(profiles, user_inputs,
+                                                      score_diff=score_diff)
+
         # Suggest alternatives
         alternatives = self.suggest_alternatives(user_inputs)
-        
-        return {
+
+        # Read-only views: these mappings are shared by reference from
+        # the cache, so callers must not be able to mutate them
+        return MappingProxyType({
             'profiles': profiles,
             'tradeoffs': tradeoffs,
             'recommendation': recommendation,
             'alternatives': alternatives,
-            'scores': scores
-        }
+            'scores': MappingProxyType(scores)
+        })
+
+    def _assemble_decision(self, user_inputs: UserInputs,
+                           decided: np.ndarray) -> Mapping:
+        """Turn the _decide kernel's flat int array into result objects.
+
+        decided holds [mysql, postgresql, mongodb, top_db, confidence,
+        tradeoff_mask, alternative_mask]; only string/object assembly
+        happens here. decided[3] is implied by the profile ordering.
+        """
+        scores = {'mysql': int(decided[0]), 'postgresql': int(decided[1]),
+                  'mongodb': int(decided[2])}
+        profiles = self.generate_database_profiles(scores)
+        tradeoffs = tuple(obj for r, obj in enumerate(self._tradeoff_objs)
+                          if decided[5] >> r & 1)
+        alternatives = tuple(obj for r, obj in enumerate(self._alternative_objs)
+                             if decided[6] >> r & 1)
+        recommendation = self.generate_recommendation(
+            profiles, user_inputs,
+            confidence=_CONFIDENCE_LEVELS[decided[4]])
+
+        return MappingProxyType({
+            'profiles': profiles,
+            'tradeoffs': tradeoffs,
+            'recommendation': recommendation,
+            'alternatives': alternatives,
+            'scores': MappingProxyType(scores)
+        })
 
 
 # Example usage
-if __name__ == '__main__':
-    engine = DecisionEngine()
-    
+def _demo(engine: DecisionEngine | None = None) -> None:
+    """Run the example analysis; kept out of module-level code so
+    importing the engine carries no demo bytecode."""
+    if engine is None:
+        engine = DecisionEngine()
+
     # Example user inputs
     test_inputs = {
         'app_type': 'Analytics',
@@ -471,22 +784,26 @@ if __name__ == '__main__':
         'transactions': 'High',
         'schema_flexibility': 'Yes'
     }
-    
+
     results = engine.analyze(test_inputs)
-    
+
     print("=== RECOMMENDATION ===")
     print(f"Database: {results['recommendation'].database}")
     print(f"Confidence: {results['recommendation'].confidence}")
     print("\nReasoning:")
     for reason in results['recommendation'].reasoning:
         print(f"  • {reason}")
-    
+
     print("\n=== DATABASE COMPARISON ===")
     for profile in results['profiles']:
         print(f"\n{profile.name} (Score: {profile.score})")
         print(f"Type: {profile.db_type}")
-    
+
     print("\n=== TRADE-OFFS ===")
     for tradeoff in results['tradeoffs']:
         print(f"\n{tradeoff.title}")
         print(f"  {tradeoff.description}")
+
+
+if __name__ == '__main__':
+    _demo()